@@ -0,0 +1,13 @@
+import os
+
+
+def pytest_addoption(parser):
+    parser.addoption('--full', action='store_true', help='Import every module and exercise URLs in test_basic.py')
+
+
+def pytest_configure(config):
+    """Set up Django once for the whole pytest session when the full checks run"""
+    if config.getoption('--full'):
+        import django
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vortexis_backend.settings')
+        django.setup()
@@ -128,6 +128,19 @@ class NotificationService:
             logger.error(f"Failed to send email to {user.email}: {str(e)}")
             return False
     
+    @staticmethod
+    def get_or_create_preferences_bulk(users):
+        """Preferences for several users keyed by user id, loaded in one query with defaults created for the rest"""
+        preferences = {
+            preference.user_id: preference
+            for preference in NotificationPreference.objects.filter(user__in=users)
+        }
+        missing = [NotificationPreference(user=user) for user in users if user.id not in preferences]
+        if missing:
+            NotificationPreference.objects.bulk_create(missing, ignore_conflicts=True)
+            preferences.update((preference.user_id, preference) for preference in missing)
+        return preferences
+    
     @staticmethod
     def send_bulk_notifications(
         users,
@@ -141,16 +154,49 @@ class NotificationService:
         send_email=True,
         send_in_app=True
     ):
-        """Send notifications to multiple users"""
-        success_count = 0
+        """
+        Send the same notification to multiple users
+        
+        Preferences are loaded in one query and all in-app notifications are written
+        with a single bulk INSERT; emails still go out per user so each is tracked.
+        
+        Returns:
+            Tuple of (success_count, total_count)
+        """
+        # Deduplicate while keeping order, the caller may pass a queryset or a list
+        users = list({user.id: user for user in users}.values())
         total_count = len(users)
+        if not users:
+            return 0, 0
         
-        for user in users:
-            if NotificationService.send_notification(
-                user, title, message, category, priority, data, 
-                action_url, action_text, send_email, send_in_app
-            ):
-                success_count += 1
+        try:
+            preferences = NotificationService.get_or_create_preferences_bulk(users)
+            
+            if send_in_app:
+                Notification.objects.bulk_create([
+                    Notification(
+                        user=user,
+                        title=title,
+                        message=message,
+                        category=category,
+                        priority=priority,
+                        data=data or {},
+                        action_url=action_url or None,
+                        action_text=action_text or None
+                    )
+                    for user in users
+                    if preferences[user.id].get_in_app_preference(category)
+                ], batch_size=500)
+            
+            if send_email:
+                for user in users:
+                    if preferences[user.id].get_email_preference(category):
+                        NotificationService.send_email_notification(user, title, message)
+            
+            success_count = total_count
+        except Exception as e:
+            logger.error(f"Error sending bulk notification '{title}': {str(e)}")
+            success_count = 0
         
         logger.info(f"Bulk notification sent: {success_count}/{total_count} successful")
         return success_count, total_count
@@ -342,9 +388,11 @@ class NotificationTemplates:
     @staticmethod
     def team_member_left(team, departed_user):
         """Notify remaining team members that someone has left"""
+        from team.utils import display_name
+
         title = f"Member Left Team: {team.name}"
         message = (
-            f"{(departed_user.first_name + ' ' + departed_user.last_name).strip() or departed_user.username} "
+            f"{display_name(departed_user)} "
             f"has left the team '{team.name}'."
         )
         return NotificationService.send_bulk_notifications(
@@ -8,10 +8,6 @@ class TeamAdmin(admin.ModelAdmin):
     list_display = ['name', 'hackathon', 'organizer', 'member_count', 'created_at']
     list_filter = ['hackathon', 'created_at']
     search_fields = ['name', 'organizer__username', 'organizer__email']
-    
-    def member_count(self, obj):
-        return obj.members.count()
-    member_count.short_description = 'Members'
 
 @admin.register(TeamInvitation)
 class TeamInvitationAdmin(admin.ModelAdmin):
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TeamConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'team'
+
+    def ready(self) -> None:
+        # Import signal handlers
+        from django.db.models.signals import post_migrate
+        from . import signals
+        post_migrate.connect(signals.ensure_member_lookup_index, sender=self)
+        return super().ready()
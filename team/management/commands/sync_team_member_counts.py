@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from team.models import Team, TeamMembership
+
+
+class Command(BaseCommand):
+    help = 'Recalculate Team.member_count from the members table (run once after adding the field)'
+
+    def handle(self, *args, **options):
+        counts = TeamMembership.objects.filter(
+            team_id=OuterRef('pk')
+        ).values('team_id').annotate(total=Count('id')).values('total')
+        updated = Team.objects.update(member_count=Coalesce(Subquery(counts), 0))
+        self.stdout.write(self.style.SUCCESS(f'Updated member_count on {updated} team(s)'))
@@ -11,6 +11,8 @@ class Team(models.Model):
     members = models.ManyToManyField('accounts.User', related_name='teams')
     organizer = models.ForeignKey('accounts.User', related_name='organized_teams', null=True, on_delete=models.SET_NULL)
     hackathon = models.ForeignKey('hackathon.Hackathon', related_name='teams', null=False, on_delete=models.CASCADE)
+    # Denormalized from members, kept in sync by team.signals
+    member_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -38,6 +40,11 @@ class Team(models.Model):
         return QuerySet().none()
 
 
+# Auto-created members table (team_team_members), named for membership queries.
+# Its (user_id, team_id) lookup index is created by team.signals.ensure_member_lookup_index.
+TeamMembership = Team.members.through
+
+
 class TeamInvitation(models.Model):
     team = models.ForeignKey(Team, related_name='invitations', on_delete=models.CASCADE)
     email = models.EmailField()
@@ -95,20 +102,14 @@ class TeamInvitation(models.Model):
         # Mark invitation as accepted
         self.is_accepted = True
         self.accepted_at = timezone.now()
-        self.save()
+        self.save(update_fields=['is_accepted', 'accepted_at'])
         
         # Update hackathon participant record if exists
         from hackathon.models import HackathonParticipant
-        try:
-            participant = HackathonParticipant.objects.get(
-                hackathon=self.team.hackathon, 
-                user=user
-            )
-            participant.team = self.team
-            participant.looking_for_team = False
-            participant.save()
-        except HackathonParticipant.DoesNotExist:
-            pass
+        HackathonParticipant.objects.filter(
+            hackathon_id=self.team.hackathon_id,
+            user=user
+        ).update(team=self.team, looking_for_team=False)
         
         return self.team
     
@@ -125,4 +126,10 @@ class TeamJoinRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ('team', 'user')
\ No newline at end of file
+        unique_together = ('team', 'user')
+        indexes = [
+            # Pending-request lookups in approve/reject and per-team listings
+            models.Index(fields=['team', 'status'], name='team_joinreq_team_status_idx'),
+            models.Index(fields=['user', 'status'], name='team_joinreq_user_status_idx'),
+            models.Index(fields=['-created_at'], name='team_joinreq_created_idx'),
+        ]
\ No newline at end of file
@@ -1,15 +1,23 @@
-from urllib import request
+import secrets
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
+from django.db import transaction
 from django.utils import timezone
 from notifications.services import NotificationService
 
 from accounts.models import User
+from hackathon.models import Hackathon
 from .models import Team, TeamInvitation, TeamJoinRequest
+from .utils import display_name, get_team_member_ids
 
 
 class CreateTeamSerializer(serializers.ModelSerializer):
-    hackathon_id = serializers.IntegerField(write_only=True)
+    hackathon_id = serializers.PrimaryKeyRelatedField(
+        queryset=Hackathon.objects.all(),
+        source='hackathon',
+        write_only=True,
+        error_messages={'does_not_exist': 'Hackathon does not exist.'}
+    )
     members = serializers.ListField(
         child=serializers.EmailField(),
         write_only=True,
@@ -23,24 +31,19 @@ class CreateTeamSerializer(serializers.ModelSerializer):
         fields = ['name', 'members', 'hackathon_id']
     
     def validate(self, data):
-        from hackathon.models import Hackathon, HackathonParticipant
+        from hackathon.models import HackathonParticipant
         
         request = self.context.get('request')
         if not request:
             raise serializers.ValidationError("Request context is required.")
         
         user = request.user
-        hackathon_id = data.get('hackathon_id')
+        # Already resolved to a Hackathon instance by the hackathon_id field
+        hackathon = data['hackathon']
         
         if not data.get('name'):
             raise serializers.ValidationError("Team name is required.")
         
-        # Validate hackathon exists
-        try:
-            hackathon = Hackathon.objects.get(id=hackathon_id)
-        except Hackathon.DoesNotExist:
-            raise serializers.ValidationError("Hackathon does not exist.")
-        
         # Check if organizer already has a team for this hackathon
         if Team.objects.filter(hackathon=hackathon, organizer=user).exists():
             raise serializers.ValidationError("You already have a team for this hackathon.")
@@ -83,7 +86,6 @@ class CreateTeamSerializer(serializers.ModelSerializer):
         
         # Add validated data for use in create method
         data['invitation_emails'] = invitation_emails
-        data['hackathon'] = hackathon
         
         return data
     
@@ -97,8 +99,7 @@ class CreateTeamSerializer(serializers.ModelSerializer):
 
         hackathon = validated_data.pop('hackathon')
         invitation_emails = validated_data.pop('invitation_emails')
-        validated_data.pop('hackathon_id')
-        validated_data.pop('members')
+        validated_data.pop('members', None)
 
         # Create team
         team = Team.objects.create(
@@ -116,25 +117,21 @@ class CreateTeamSerializer(serializers.ModelSerializer):
         participant.looking_for_team = False
         participant.save()
 
-        # Send invitations to ALL invited members
-        for email in invitation_emails:
-            invitation = TeamInvitation.objects.create(
-                team=team,
-                email=email,
-                invited_by=user
-            )
+        # Create every invitation in one INSERT; bulk_create skips save(), so tokens are set here
+        invitations = TeamInvitation.objects.bulk_create([
+            TeamInvitation(team=team, email=email, invited_by=user, token=secrets.token_urlsafe(32))
+            for email in invitation_emails
+        ])
+        existing_users = {member.email: member for member in User.objects.filter(email__in=invitation_emails)}
+        organizer_name = display_name(user)
 
-            # Check if user already exists
-            try:
-                existing_user = User.objects.get(email=email)
-                user_exists = True
-            except User.DoesNotExist:
-                existing_user = None
-                user_exists = False
+        # Send invitations to ALL invited members
+        for invitation in invitations:
+            email = invitation.email
+            existing_user = existing_users.get(email)
+            user_exists = existing_user is not None
 
             # Send invitation email
-            organizer_name = (user.first_name + ' ' + user.last_name).strip() or user.username
-
             if user_exists:
                 # User exists - direct invitation
                 subject = f"Team Invitation: Join {team.name} for {hackathon.title}"
@@ -252,7 +249,7 @@ class TeamSerializer(serializers.ModelSerializer):
                 'username': member.username,
                 'first_name': member.first_name,
                 'last_name': member.last_name,
-                'is_creator': member == obj.organizer  # Flag to identify creator among members
+                'is_creator': member.id == obj.organizer_id  # Flag to identify creator among members
             }
 
             # Add profile picture if available
@@ -282,7 +279,31 @@ class TeamSerializer(serializers.ModelSerializer):
       if not request or not request.user.is_authenticated:
          return False
 
-      return obj.members.filter(id=request.user.id).exists()
+      # Served from prefetched members when available instead of a query per team
+      return any(member.id == request.user.id for member in obj.members.all())
+
+class SlimTeamSerializer(serializers.ModelSerializer):
+    """Minimal team payload: id, name and organizer_id"""
+    organizer_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Team
+        fields = ['id', 'name', 'organizer_id']
+
+
+class TeamSummarySerializer(SlimTeamSerializer):
+    """Team summary returned by mutating endpoints; member_count is the denormalized column, not a COUNT"""
+    hackathon_id = serializers.IntegerField(read_only=True)
+
+    class Meta(SlimTeamSerializer.Meta):
+        fields = SlimTeamSerializer.Meta.fields + ['hackathon_id', 'member_count']
+        read_only_fields = ['member_count']
+
+
+class ByHackathonQuery(serializers.Serializer):
+    """Query parameters of the by_hackathon endpoint"""
+    hackathon_id = serializers.IntegerField(min_value=1)
+
 
 class UpdateTeamSerializer(serializers.ModelSerializer):
     class Meta:
@@ -295,7 +316,7 @@ class UpdateTeamSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Request context is required.")
         user = request.user
         team = self.instance
-        if team.organizer != user:
+        if team.organizer_id != user.id:
             raise AuthenticationFailed("You are not authorized to update this team.")
         
         if not data.get('name'):
@@ -328,7 +349,7 @@ class AddMemberSerializer(serializers.Serializer):
             raise serializers.ValidationError("Request context is required.")
         user = request.user
         team = self.instance
-        if team and team.organizer != user:
+        if team and team.organizer_id != user.id:
             raise AuthenticationFailed("You are not authorized to add members to this team.")
         
         # Check if there's already an invitation for this email
@@ -341,10 +362,12 @@ class AddMemberSerializer(serializers.Serializer):
         if existing_invitation and existing_invitation.is_valid():
             raise serializers.ValidationError("An invitation has already been sent to this email.")
         
+        member_ids = get_team_member_ids(team)
+        
         # Check if user exists and is already a member
         try:
             member = User.objects.get(email=value)
-            if member in team.members.all():
+            if member.id in member_ids:
                 raise serializers.ValidationError("User is already a member of this team.")
             
             # If user exists and is registered for hackathon, check if they have a team
@@ -361,7 +384,7 @@ class AddMemberSerializer(serializers.Serializer):
             team=team, 
             is_accepted=False
         ).count()
-        current_size = team.members.count() + pending_invitations
+        current_size = len(member_ids) + pending_invitations
         
         if current_size >= team.hackathon.max_team_size:
             raise serializers.ValidationError("Team has reached maximum size including pending invitations.")
@@ -406,7 +429,7 @@ class AddMemberSerializer(serializers.Serializer):
         # Prepare email content
         hackathon_title = team.hackathon.title
         team_name = team.name
-        organizer_name = (request.user.first_name + ' ' + request.user.last_name).strip() or request.user.username
+        organizer_name = display_name(request.user)
         
         if user_exists:
             # User exists - direct invitation
@@ -496,7 +519,7 @@ class RemoveMemberSerializer(serializers.Serializer):
             raise serializers.ValidationError("Request context is required.")
         user = request.user
         team = self.instance
-        if team.organizer != user:
+        if team.organizer_id != user.id:
             raise AuthenticationFailed("You are not authorized to remove members from this team.")
         
         try:
@@ -504,14 +527,15 @@ class RemoveMemberSerializer(serializers.Serializer):
         except User.DoesNotExist:
             raise serializers.ValidationError("User with this email does not exist.")
         
-        if member not in team.members.all():
+        member_ids = get_team_member_ids(team)
+        if member.id not in member_ids:
             raise serializers.ValidationError("User is not a member of this team.")
         
-        if member == team.organizer:
+        if member.id == team.organizer_id:
             raise serializers.ValidationError("Cannot remove the team organizer.")
         
         # Check team size constraints
-        if team.members.count() <= team.hackathon.min_team_size:
+        if len(member_ids) <= team.hackathon.min_team_size:
             raise serializers.ValidationError("Cannot remove member. Team would fall below minimum size.")
         
         return value
@@ -548,14 +572,15 @@ class LeaveTeamSerializer(serializers.Serializer):
         user = request.user
         team = self.instance
         
-        if user not in team.members.all():
+        member_ids = get_team_member_ids(team)
+        if user.id not in member_ids:
             raise serializers.ValidationError("You are not a member of this team.")
         
-        if user == team.organizer:
+        if user.id == team.organizer_id:
             raise serializers.ValidationError("Team organizers cannot leave their own team. Delete the team instead.")
         
         # Check team size constraints
-        if team.members.count() <= team.hackathon.min_team_size:
+        if len(member_ids) <= team.hackathon.min_team_size:
             raise serializers.ValidationError("Cannot leave team. Team would fall below minimum size.")
         
         return data
@@ -596,12 +621,22 @@ class AcceptTeamInvitationSerializer(serializers.Serializer):
             raise serializers.ValidationError("Invalid invitation token.")
 
     def save(self):
+        from .models import TeamInvitation
+
         invitation = self.validated_data['token']
         request = self.context.get('request')
         user = request.user
         
-        # Accept the invitation
-        team = invitation.accept(user)
+        # Lock the invitation so two concurrent accepts cannot both pass the validity check;
+        # of=('self',) keeps the joined team and hackathon rows unlocked
+        with transaction.atomic():
+            invitation = TeamInvitation.objects.select_for_update(of=('self',)).select_related(
+                'team__hackathon'
+            ).get(pk=invitation.pk)
+            try:
+                team = invitation.accept(user)
+            except ValueError as e:
+                raise serializers.ValidationError({'token': [str(e)]})
         
         return {
             'team': team,
@@ -652,6 +687,14 @@ class TeamJoinRequestSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'team', 'status', 'created_at']
         read_only_fields = ['id', 'status', 'created_at']
     
+    # Relations read by get_user/get_team; keep in step when they render more
+    select_related_fields = ('user', 'team__hackathon')
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Apply the joins this serializer needs so a list of join requests renders without per-row queries"""
+        return queryset.select_related(*cls.select_related_fields)
+    
     def get_user(self, obj):
         """Get user details"""
         return {
@@ -0,0 +1,107 @@
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Team, TeamMembership
+from .utils import forget_user_teams, get_team_member_ids
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def sync_team_member_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep Team.member_count and updated_at in step with the members table"""
+    if reverse:
+        # user.teams.add()/remove()/clear(): instance is the user and pk_set holds team ids
+        if action == 'pre_clear':
+            instance._cleared_team_ids = set(
+                sender.objects.filter(user_id=instance.pk).values_list('team_id', flat=True)
+            )
+            return
+        if action == 'post_clear':
+            team_ids = getattr(instance, '_cleared_team_ids', set())
+        elif action in {'post_add', 'post_remove'}:
+            team_ids = pk_set or set()
+        else:
+            return
+    else:
+        # team.members.add()/remove()/clear(): instance is the team and pk_set holds user ids
+        if action == 'pre_clear':
+            instance._cleared_member_ids = set(
+                sender.objects.filter(team_id=instance.pk).values_list('user_id', flat=True)
+            )
+            return
+        if action not in {'post_add', 'post_remove', 'post_clear'}:
+            return
+        team_ids = {instance.pk}
+
+    if reverse:
+        hackathon_ids = Team.objects.filter(pk__in=team_ids).values_list('hackathon_id', flat=True)
+        forget_user_teams((instance.pk, hackathon_id) for hackathon_id in hackathon_ids)
+    else:
+        user_ids = getattr(instance, '_cleared_member_ids', set()) if action == 'post_clear' else pk_set or set()
+        forget_user_teams((user_id, instance.hackathon_id) for user_id in user_ids)
+
+    for team_id in team_ids:
+        member_ids = set(sender.objects.filter(team_id=team_id).values_list('user_id', flat=True))
+        # Bumping updated_at keeps the team ETags in step with membership changes
+        Team.objects.filter(pk=team_id).update(member_count=len(member_ids), updated_at=timezone.now())
+        if not reverse:
+            instance.member_count = len(member_ids)
+
+
+@receiver(pre_delete, sender=Team)
+def forget_deleted_team(sender, instance, **kwargs):
+    """
+    Deleting a team cascades to its membership rows without sending m2m_changed.
+    Drop the cached lookups of its members up front so the rows are still fast-deleted.
+    """
+    member_ids = TeamMembership.objects.filter(team_id=instance.pk).values_list('user_id', flat=True)
+    forget_user_teams((user_id, instance.hackathon_id) for user_id in member_ids)
+
+
+@receiver(pre_delete, sender='accounts.User')
+def detach_deleted_user(sender, instance, **kwargs):
+    """
+    Deleting a user cascades to their membership rows without sending m2m_changed, so
+    decrement the affected teams' member counts in one UPDATE and drop their cached lookups
+    """
+    teams = list(Team.objects.filter(members=instance).values_list('pk', 'hackathon_id'))
+    if not teams:
+        return
+    team_ids = [team_id for team_id, _ in teams]
+    Team.objects.filter(pk__in=team_ids).update(
+        member_count=Greatest(F('member_count') - 1, Value(0)),
+        updated_at=timezone.now()
+    )
+    forget_user_teams((instance.pk, hackathon_id) for _, hackathon_id in teams)
+
+
+@receiver(post_save, sender=Team)
+def invalidate_member_team_lookups(sender, instance, created, **kwargs):
+    """Renames and organizer changes alter the cached by_hackathon payload of every member"""
+    if created:
+        return
+    forget_user_teams((user_id, instance.hackathon_id) for user_id in get_team_member_ids(instance))
+
+
+def ensure_member_lookup_index(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    post_migrate: create the (user_id, team_id) index membership lookups from the user side
+    (EXISTS probes, by_hackathon) rely on. The members table is the auto-created M2M one,
+    which takes no Meta.indexes, and migrations are generated per deployment, so the index
+    is created here idempotently instead of in a migration.
+    """
+    if not router.allow_migrate_model(using, TeamMembership):
+        return
+    connection = connections[using]
+    # post_migrate also follows `migrate <other app>` on a fresh database and `migrate team zero`
+    if TeamMembership._meta.db_table not in connection.introspection.table_names():
+        return
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote('team_members_user_team_idx')} "
+            f"ON {quote(TeamMembership._meta.db_table)} ({quote('user_id')}, {quote('team_id')})"
+        )
@@ -0,0 +1,56 @@
+"""
+Background delivery for team emails.
+
+Team emails run on a small thread pool reserved for email, so slow SMTP
+round-trips never hold a request worker and are capped at a fixed
+concurrency (TEAM_EMAIL_WORKERS) to stay within SMTP provider quotas.
+Emails queued in a burst are drained together and share one SMTP connection.
+"""
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import transaction
+from .utils import send_team_emails
+
+logger = logging.getLogger(__name__)
+
+_email_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'TEAM_EMAIL_WORKERS', 2),
+    thread_name_prefix='team-email'
+)
+_pending_emails = queue.SimpleQueue()
+
+
+def _drain_pending_emails():
+    """Send every email queued so far in one batch; a drain that finds nothing just returns"""
+    batch = []
+    while True:
+        try:
+            batch.append(_pending_emails.get_nowait())
+        except queue.Empty:
+            break
+    if not batch:
+        return
+    try:
+        send_team_emails(batch)
+    except Exception as e:
+        logger.error(f"Failed to deliver {len(batch)} team email(s): {str(e)}")
+
+
+def _enqueue_team_email(item):
+    _pending_emails.put(item)
+    _email_executor.submit(_drain_pending_emails)
+
+
+def queue_team_email(subject, message, recipient_list):
+    """
+    Queue a team email on the dedicated email pool and return immediately
+
+    Only plain strings cross into the worker thread, and nothing is handed over
+    until the surrounding transaction commits, so rolled-back changes never
+    produce an email.
+    """
+    subject, message = str(subject), str(message)
+    recipients = [str(email) for email in recipient_list]
+    transaction.on_commit(lambda: _enqueue_team_email((subject, message, recipients)))
@@ -1,4 +1,7 @@
-from django.test import TestCase
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from django.utils import timezone
 
@@ -12,17 +15,12 @@ class TeamNotificationsTest(TestCase):
     """Verify notifications are generated when a member leaves a team."""
 
     def setUp(self):
-        # create two users: organizer and member
-        self.organizer = User.objects.create_user(
-            username='organizer',
-            email='org@example.com',
-            password='password123'
-        )
-        self.member = User.objects.create_user(
-            username='member',
-            email='member@example.com',
-            password='password123'
-        )
+        # create two users: organizer and member in one INSERT, hashing the password once
+        password = make_password('password123')
+        self.organizer, self.member = User.objects.bulk_create([
+            User(username='organizer', email='org@example.com', first_name='Organizer', password=password),
+            User(username='member', email='member@example.com', first_name='Member', password=password),
+        ])
 
         # create a simple hackathon
         now = timezone.now()
@@ -36,8 +34,10 @@ class TeamNotificationsTest(TestCase):
         )
 
         # add participants
-        HackathonParticipant.objects.create(hackathon=self.hackathon, user=self.organizer)
-        HackathonParticipant.objects.create(hackathon=self.hackathon, user=self.member)
+        HackathonParticipant.objects.bulk_create([
+            HackathonParticipant(hackathon=self.hackathon, user=user)
+            for user in (self.organizer, self.member)
+        ])
 
         # create a team with both users
         self.team = Team.objects.create(
@@ -69,3 +69,133 @@ class TeamNotificationsTest(TestCase):
         self.assertFalse(Notification.objects.filter(user=self.member).exists())
         self.assertFalse(EmailNotification.objects.filter(user=self.member).exists())
 
+
+class TeamListQueryCountTest(TestCase):
+    """The team list should run a constant number of queries however many teams the user is in."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='member@example.com',
+            username='member',
+            first_name='Member',
+            password='password123'
+        )
+
+        now = timezone.now()
+        self.hackathon = Hackathon.objects.create(
+            title='Test Hack',
+            description='Just a test',
+            venue='Online',
+            start_date=now.date(),
+            end_date=(now + timezone.timedelta(days=1)).date(),
+            submission_deadline=now + timezone.timedelta(days=2),
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def make_teams(self, start, count):
+        for i in range(start, start + count):
+            team = Team.objects.create(name=f'Team {i}', hackathon=self.hackathon)
+            team.members.add(self.user)
+
+    def test_list_query_count_does_not_grow_with_teams(self):
+        self.make_teams(0, 1)
+        with CaptureQueriesContext(connection) as single_team:
+            resp = self.client.get('/api/v1/team/teams/')
+        self.assertEqual(resp.status_code, 200)
+
+        self.make_teams(1, 19)
+        with self.assertNumQueries(len(single_team.captured_queries)):
+            resp = self.client.get('/api/v1/team/teams/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['count'], 20)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TeamChangeTrackingTest(TestCase):
+    """ETags, member counts and cached lookups should follow membership and team changes."""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            email='org@example.com', username='organizer', first_name='Organizer', password='password123'
+        )
+        self.member = User.objects.create_user(
+            email='member@example.com', username='member', first_name='Member', password='password123'
+        )
+
+        now = timezone.now()
+        self.hackathon = Hackathon.objects.create(
+            title='Test Hack',
+            description='Just a test',
+            venue='Online',
+            start_date=now.date(),
+            end_date=(now + timezone.timedelta(days=1)).date(),
+            submission_deadline=now + timezone.timedelta(days=2),
+        )
+
+        self.team = Team.objects.create(name='Alpha', organizer=self.organizer, hackathon=self.hackathon)
+        self.team.members.add(self.organizer)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.organizer)
+
+    def get_detail(self, **headers):
+        return self.client.get(f'/api/v1/team/teams/{self.team.id}/', **headers)
+
+    def test_etag_revalidates_until_a_member_is_added(self):
+        etag = self.get_detail()['ETag']
+        self.assertEqual(self.get_detail(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.team.members.add(self.member)
+        resp = self.get_detail(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data['members']), 2)
+
+    def test_etag_changes_when_the_team_is_renamed(self):
+        etag = self.get_detail()['ETag']
+
+        self.team.name = 'Beta'
+        self.team.save()
+        resp = self.get_detail(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['name'], 'Beta')
+
+    def test_member_count_follows_add_remove_and_user_delete(self):
+        third = User.objects.create_user(
+            email='third@example.com', username='third', first_name='Third', password='password123'
+        )
+
+        self.team.members.add(self.member, third)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.member_count, 3)
+
+        self.team.members.remove(self.member)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.member_count, 2)
+
+        third.delete()
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.member_count, 1)
+
+    def test_by_hackathon_follows_membership_changes(self):
+        self.client.force_authenticate(user=self.member)
+        url = f'/api/v1/team/teams/by_hackathon/?hackathon_id={self.hackathon.id}'
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        # the cached lookup is dropped once the change commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.members.add(self.member)
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['id'], self.team.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.members.remove(self.member)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_non_numeric_team_id_is_not_found(self):
+        self.assertEqual(self.client.get('/api/v1/team/teams/abc/').status_code, 404)
+        self.assertEqual(self.client.get('/api/v1/team/teams/abc/details/').status_code, 404)
+        resp = self.client.post('/api/v1/team/teams/abc/add_member/', {'member_email': 'member@example.com'})
+        self.assertEqual(resp.status_code, 404)
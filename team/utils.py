@@ -0,0 +1,83 @@
+import logging
+import smtplib
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Recipients per message, keeps each envelope well under common SMTP RCPT limits
+EMAIL_BATCH_SIZE = 50
+
+USER_TEAM_CACHE_TIMEOUT = 5 * 60
+
+
+def user_team_cache_key(user_id, hackathon_id):
+    return f"team:u{user_id}:h{hackathon_id}"
+
+
+def forget_user_teams(pairs):
+    """
+    Drop cached by_hackathon lookups for the given (user_id, hackathon_id) pairs once the
+    current transaction commits, so a lookup made before the commit cannot re-cache the old team
+    """
+    keys = [user_team_cache_key(user_id, hackathon_id) for user_id, hackathon_id in pairs]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def get_team_member_ids(team):
+    """
+    Set of the team's member ids, read from the members table in one query.
+    Membership and team-size checks guard writes, so this is never served from cache.
+    """
+    from .models import TeamMembership
+
+    return set(TeamMembership.objects.filter(team_id=team.id).values_list('user_id', flat=True))
+
+
+def display_name(user):
+    """Name used in team emails: the user's full name, falling back to their username"""
+    return (user.first_name + ' ' + (user.last_name or '')).strip() or user.username
+
+
+def send_team_emails(messages):
+    """
+    Send several team emails over a single SMTP connection
+
+    Recipients are BCC'd so team members' addresses are not exposed to each other,
+    and recipient lists larger than EMAIL_BATCH_SIZE are split into several messages.
+    A message the server refuses is logged and skipped without dropping the rest.
+
+    Args:
+        messages: Iterable of (subject, message, recipient_list) tuples
+
+    Returns:
+        Number of messages successfully sent
+    """
+    sent = 0
+    connection = mail.get_connection()
+    with connection:
+        for subject, message, recipient_list in messages:
+            recipients = [email for email in recipient_list if email]
+            for start in range(0, len(recipients), EMAIL_BATCH_SIZE):
+                email = mail.EmailMessage(
+                    subject=subject,
+                    body=message,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    bcc=recipients[start:start + EMAIL_BATCH_SIZE],
+                    connection=connection
+                )
+                try:
+                    sent += email.send()
+                except smtplib.SMTPException as e:
+                    logger.error(f"Failed to send team email '{subject}': {str(e)}")
+
+    logger.info(f"Team email batch sent {sent} message(s)")
+    return sent
+
+
+def send_team_email(subject, message, recipient_list):
+    """Send a single team email, see send_team_emails"""
+    return send_team_emails([(subject, message, recipient_list)])
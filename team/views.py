@@ -4,23 +4,168 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
-from rest_framework.generics import GenericAPIView
-from django.core.mail import send_mail
-from django.conf import settings
+from rest_framework.generics import get_object_or_404
+from rest_framework.pagination import PageNumberPagination
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Exists, Max, OuterRef, Prefetch, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+import hashlib
+from accounts.models import User
+from hackathon.models import Hackathon, HackathonParticipant, Submission
+from project.models import Project
 from notifications.services import NotificationService
-from .serializers import CreateTeamSerializer, TeamSerializer, UpdateTeamSerializer, AddMemberSerializer, RemoveMemberSerializer, LeaveTeamSerializer, AcceptTeamInvitationSerializer, TeamInvitationSerializer, TeamJoinRequestSerializer
-from admin_console.models import Team
+from .serializers import CreateTeamSerializer, TeamSerializer, SlimTeamSerializer, TeamSummarySerializer, ByHackathonQuery, UpdateTeamSerializer, AddMemberSerializer, RemoveMemberSerializer, LeaveTeamSerializer, AcceptTeamInvitationSerializer, TeamJoinRequestSerializer
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from .models import Team, TeamJoinRequest
-from django.shortcuts import get_object_or_404
-from notifications.services import NotificationService
+from .models import Team, TeamJoinRequest, TeamMembership
+from .tasks import queue_team_email
+from .utils import USER_TEAM_CACHE_TIMEOUT, display_name, user_team_cache_key
 
 # Create your views here.
 
-class TeamViewSet(ModelViewSet):
+def member_of(user):
+    """EXISTS clause matching teams the user belongs to, avoiding a JOIN + DISTINCT on the through table"""
+    return Exists(TeamMembership.objects.filter(team_id=OuterRef('pk'), user_id=user.id))
+
+
+# User columns team emails need: the address plus what display_name() reads
+EMAIL_MEMBER_FIELDS = ('email', 'first_name', 'last_name', 'username')
+
+# Only the user columns TeamSerializer renders for organizer and members
+TEAM_USER_FIELDS = ('id', 'username', 'first_name', 'last_name', 'profile__profile_picture')
+
+
+def with_team_relations(queryset):
+    """
+    Eager-load everything TeamSerializer renders so team lists run a constant number of queries.
+    Columns are trimmed to the rendered ones; extend the only() lists when the serializer grows.
+    """
+    team_members = Prefetch(
+        'members',
+        queryset=User.objects.select_related('profile').only(*TEAM_USER_FIELDS)
+    )
+    return queryset.select_related(
+        'hackathon', 'organizer__profile'
+    ).only(
+        'id', 'name', 'created_at', 'updated_at', 'hackathon', 'organizer',
+        'hackathon__title', 'hackathon__start_date', 'hackathon__end_date',
+        *(f'organizer__{field}' for field in TEAM_USER_FIELDS),
+    ).prefetch_related(
+        team_members,
+        'projects',
+        'submissions__project',
+    )
+
+
+def teams_etag(teams, user):
+    """
+    ETag covering what TeamSerializer renders for the given teams, or None if there are none.
+    Membership changes bump Team.updated_at (see team.signals); projects and submissions
+    render inside each team so their counts and latest changes are folded in as well.
+    The hackathon (title and dates) is covered by its updated_at. Users carry no change
+    timestamp, so the organizer and member columns TeamSerializer renders are hashed as is.
+    """
+    version = teams.aggregate(count=Count('id'), changed=Max('updated_at'))
+    if not version['count']:
+        return None
+    team_ids = teams.values('id')
+    projects = Project.objects.filter(team__in=team_ids).aggregate(count=Count('id'), changed=Max('updated_at'))
+    submissions = Submission.objects.filter(team__in=team_ids).aggregate(count=Count('id'), changed=Max('updated_at'))
+    hackathons = list(
+        Hackathon.objects.filter(pk__in=teams.values('hackathon_id')).order_by('pk').values_list('pk', 'updated_at')
+    )
+    people = list(
+        User.objects.filter(
+            Q(pk__in=TeamMembership.objects.filter(team_id__in=team_ids).values('user_id'))
+            | Q(pk__in=teams.values('organizer_id'))
+        ).order_by('pk').values_list(*TEAM_USER_FIELDS)
+    )
+    # is_member_of varies per user, so the requesting user is part of the validator
+    return hashlib.md5(repr((user.id, version, projects, submissions, hackathons, people)).encode()).hexdigest()
+
+
+def team_list_etag(request, *args, **kwargs):
+    return teams_etag(Team.objects.filter(member_of(request.user)), request.user)
+
+
+def team_detail_etag(request, pk=None, *args, **kwargs):
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        # The router accepts any pk; leave malformed ones to the view's lookup, which answers 404
+        return None
+    return teams_etag(Team.objects.filter(pk=pk), request.user)
+
+
+def user_hackathon_team(user, hackathon_id):
+    """
+    Slim {id, name, organizer_id} of the user's team in the hackathon, or {} when they have none.
+    Cached per user and hackathon; team.signals drops the entry once a membership or team change commits.
+    """
+    return cache.get_or_set(
+        user_team_cache_key(user.id, hackathon_id),
+        lambda: Team.objects.filter(
+            member_of(user), hackathon_id=hackathon_id
+        ).values('id', 'name', 'organizer_id').first() or {},
+        USER_TEAM_CACHE_TIMEOUT
+    )
+
+
+def team_by_hackathon_etag(request, *args, **kwargs):
+    query = ByHackathonQuery(data=request.query_params)
+    if not query.is_valid():
+        # Let the view report the bad parameter
+        return None
+    hackathon_id = query.validated_data['hackathon_id']
+    if request.query_params.get('full') == '1':
+        return teams_etag(Team.objects.filter(member_of(request.user), hackathon_id=hackathon_id), request.user)
+    # The slim payload is tagged straight from the cache, so a revalidation never reaches the database
+    team = user_hackathon_team(request.user, hackathon_id)
+    if not team:
+        return None
+    return hashlib.md5(repr(sorted(team.items())).encode()).hexdigest()
+
+
+include_members_param = openapi.Parameter(
+    'include',
+    openapi.IN_QUERY,
+    description='Pass "members" to return the full team with members instead of the slim team payload',
+    type=openapi.TYPE_STRING,
+    required=False,
+    enum=['members']
+)
+
+
+class TeamPagination(PageNumberPagination):
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class TeamLookupMixin:
+    """Shared lookup for actions that receive the team id in the request rather than the URL"""
+
+    def get_team(self, team_id):
+        # Organizer and hackathon are joined in since every caller checks or mentions them
+        return get_object_or_404(Team.objects.select_related('organizer', 'hackathon'), id=team_id)
+    
+    def get_pending_join_request(self, team, join_request_id=None, user_id=None):
+        """Pending join request by id, by requester, or the team's first pending one, with the requester joined"""
+        lookup = {'team': team, 'status': 'pending'}
+        if join_request_id:
+            lookup['id'] = join_request_id
+        elif user_id:
+            lookup['user_id'] = user_id
+        # Joins the requester as well, whom approve and reject notify
+        return TeamJoinRequestSerializer.setup_eager_loading(TeamJoinRequest.objects.filter(**lookup)).first()
+
+
+class TeamViewSet(TeamLookupMixin, ModelViewSet):
     queryset = Team.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = TeamPagination
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -29,43 +174,71 @@ class TeamViewSet(ModelViewSet):
             return UpdateTeamSerializer
         return TeamSerializer
     
+    def get_mutation_team_data(self, team):
+        """Team summary for mutating actions, full TeamSerializer output only with ?include=members"""
+        if self.request.query_params.get('include') == 'members':
+            # Re-read with the serializer's relations eager-loaded rather than lazily per field
+            team = with_team_relations(Team.objects.filter(pk=team.pk)).get()
+            return TeamSerializer(team, context={'request': self.request}).data
+        return TeamSummarySerializer(team).data
+    
+    @method_decorator(condition(etag_func=team_list_etag))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+    
+    @method_decorator(condition(etag_func=team_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+    
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return Team.objects.none()
         # Return teams where user is a member or organizer
-        return Team.objects.filter(members=self.request.user).distinct()
+        queryset = Team.objects.filter(member_of(self.request.user))
+        if self.action in ('list', 'retrieve'):
+            queryset = with_team_relations(queryset)
+        elif self.action == 'leave_team':
+            # LeaveTeamSerializer checks the organizer and the hackathon's minimum team size
+            queryset = queryset.select_related('organizer', 'hackathon')
+        return queryset
+    
+    def get_organized_team(self, pk, message):
+        """Team for organizer-only actions, with the organizer check done on the row get_team loaded"""
+        team = self.get_team(pk)
+        if team.organizer_id != self.request.user.id:
+            raise PermissionDenied(message)
+        return team
     
     def perform_create(self, serializer):
         team = serializer.save()
         
+        # hackathon and organizer are cached on the new instance; load members once
+        hackathon_title = team.hackathon.title
+        organizer_name = display_name(team.organizer) if team.organizer else 'Unknown'
+        members = list(team.members.only(*EMAIL_MEMBER_FIELDS))
+        member_names = ', '.join(display_name(member) for member in members)
+        
         # Send email notifications to all team members
-        send_mail(
-            subject=f"Team Created for {team.hackathon.title}",
-            message=f"Dear Team,\n\nA new team '{team.name}' has been created for '{team.hackathon.title}'.\nTeam Organizer: {((team.organizer.first_name + ' ' + team.organizer.last_name).strip() or team.organizer.username) if team.organizer else 'Unknown'}\nMembers: {', '.join([((member.first_name + ' ' + member.last_name).strip() or member.username) for member in team.members.all()])}\n\nGood luck with the hackathon!",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[member.email for member in team.members.all()],
-            fail_silently=True
+        queue_team_email(
+            subject=f"Team Created for {hackathon_title}",
+            message=f"Dear Team,\n\nA new team '{team.name}' has been created for '{hackathon_title}'.\nTeam Organizer: {organizer_name}\nMembers: {member_names}\n\nGood luck with the hackathon!",
+            recipient_list=[member.email for member in members]
         )
     
-    def perform_destroy(self, instance):
-        if instance.organizer != self.request.user:
+    def check_object_permissions(self, request, obj):
+        super().check_object_permissions(request, obj)
+        if self.action == 'destroy' and obj.organizer_id != request.user.id:
             raise PermissionDenied("You are not authorized to delete this team.")
-        
-        # Update participant records before deleting team
-        from hackathon.models import HackathonParticipant
-        for member in instance.members.all():
-            try:
-                participant = HackathonParticipant.objects.get(
-                    hackathon=instance.hackathon, 
-                    user=member
-                )
-                participant.team = None
-                participant.looking_for_team = True
-                participant.save()
-            except HackathonParticipant.DoesNotExist:
-                pass
-        
-        instance.delete()
+    
+    def perform_destroy(self, instance):
+        # Release every member's participant record in one UPDATE, with the member ids
+        # resolved in the database, and delete the team in the same transaction
+        with transaction.atomic():
+            HackathonParticipant.objects.filter(
+                hackathon_id=instance.hackathon_id,
+                user_id__in=TeamMembership.objects.filter(team_id=instance.pk).values('user_id')
+            ).update(team=None, looking_for_team=True)
+            instance.delete()
     
     @swagger_auto_schema(
         request_body=AddMemberSerializer,
@@ -81,7 +254,7 @@ class TeamViewSet(ModelViewSet):
     @action(detail=True, methods=['post'], serializer_class=AddMemberSerializer)
     def add_member(self, request, pk=None):
         """Send invitation to join the team"""
-        team = self.get_object()
+        team = self.get_organized_team(pk, "You are not authorized to add members to this team.")
         serializer = AddMemberSerializer(team, data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         result = serializer.save()
@@ -93,8 +266,9 @@ class TeamViewSet(ModelViewSet):
     
     @swagger_auto_schema(
         request_body=RemoveMemberSerializer,
+        manual_parameters=[include_members_param],
         responses={
-            200: TeamSerializer,
+            200: TeamSummarySerializer,
             400: "Bad Request - validation errors",
             403: "Forbidden - not the team organizer",
             404: "Team not found"
@@ -105,11 +279,11 @@ class TeamViewSet(ModelViewSet):
     @action(detail=True, methods=['post'], serializer_class=RemoveMemberSerializer)
     def remove_member(self, request, pk=None):
         """Remove a member from the team"""
-        team = self.get_object()
+        team = self.get_organized_team(pk, "You are not authorized to remove members from this team.")
         serializer = RemoveMemberSerializer(team, data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         serializer.save()
-        return Response({'team': TeamSerializer(team).data}, status=status.HTTP_200_OK)
+        return Response({'team': self.get_mutation_team_data(team)}, status=status.HTTP_200_OK)
     
     @swagger_auto_schema(
         request_body=LeaveTeamSerializer,
@@ -131,18 +305,18 @@ class TeamViewSet(ModelViewSet):
         serializer.save()
         
         # Notify team participants that someone has left
-        remaining_members = list(team.members.all())
+        remaining_members = list(team.members.only(*EMAIL_MEMBER_FIELDS))
         departed = request.user
 
         if remaining_members:
             # first send traditional email for backwards compatibility
             recipient_emails = [member.email for member in remaining_members]
-            send_mail(
+            member_names = ', '.join(display_name(member) for member in remaining_members)
+            organizer_name = display_name(team.organizer) if team.organizer else 'Unknown'
+            queue_team_email(
                 subject=f"Member Left Team: {team.name}",
-                message=f"Dear Team,\n\n{(departed.first_name + ' ' + departed.last_name).strip() or departed.username} has left the team '{team.name}'.\n\nRemaining members: {', '.join([((member.first_name + ' ' + member.last_name).strip() or member.username) for member in remaining_members])}\n\nTeam Organizer: {((team.organizer.first_name + ' ' + team.organizer.last_name).strip() or team.organizer.username) if team.organizer else 'Unknown'}",
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=recipient_emails,
-                fail_silently=True
+                message=f"Dear Team,\n\n{display_name(departed)} has left the team '{team.name}'.\n\nRemaining members: {member_names}\n\nTeam Organizer: {organizer_name}",
+                recipient_list=recipient_emails
             )
 
             # create in‑app/email notifications via NotificationService
@@ -164,11 +338,12 @@ class TeamViewSet(ModelViewSet):
     def my_teams(self, request):
         """Get all teams the authenticated user is part of, regardless of hackathons"""
         # Get all teams where user is a member or organizer
-        teams = Team.objects.filter(members=request.user).distinct().order_by('-created_at')
-        serializer = TeamSerializer(teams, many=True, context={'request': request})
+        teams = with_team_relations(Team.objects.filter(member_of(request.user))).order_by('-created_at')
+        # Serializing evaluates the queryset once; count the rows in memory instead of a COUNT query
+        data = TeamSerializer(teams, many=True, context={'request': request}).data
         return Response({
-            'count': teams.count(),
-            'teams': serializer.data
+            'count': len(data),
+            'teams': data
         }, status=status.HTTP_200_OK)
     
     @swagger_auto_schema(
@@ -179,39 +354,50 @@ class TeamViewSet(ModelViewSet):
                 description='The ID of the hackathon to get the user\'s team for',
                 type=openapi.TYPE_INTEGER,
                 required=True
+            ),
+            openapi.Parameter(
+                'full',
+                openapi.IN_QUERY,
+                description='Pass 1 to return the full team instead of just id, name and organizer_id',
+                type=openapi.TYPE_INTEGER,
+                required=False,
+                enum=[1]
             )
         ],
         responses={
-            200: TeamSerializer,
-            400: "Bad Request - hackathon_id parameter required",
+            200: SlimTeamSerializer,
+            400: "Bad Request - hackathon_id missing or not a positive integer",
             404: "Not Found - No team found for this hackathon"
         },
         operation_description="Get the team that the authenticated user is part of for a specific hackathon",
         tags=['teams']
     )
     @action(detail=False, methods=['get'])
+    @method_decorator(condition(etag_func=team_by_hackathon_etag))
     def by_hackathon(self, request):
         """Get user's team for a specific hackathon"""
-        hackathon_id = request.query_params.get('hackathon_id')
-        if not hackathon_id:
-            return Response({'error': 'hackathon_id parameter required'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        try:
-            hackathon_id = int(hackathon_id)
-        except ValueError:
-            return Response({'error': 'Invalid hackathon_id'}, status=status.HTTP_400_BAD_REQUEST)
+        query = ByHackathonQuery(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        hackathon_id = query.validated_data['hackathon_id']
         
-        team = Team.objects.filter(
-            members=request.user, 
-            hackathon_id=hackathon_id
-        ).first()
-        
-        if team:
-            return Response(TeamSerializer(team).data, status=status.HTTP_200_OK)
+        if request.query_params.get('full') == '1':
+            teams = Team.objects.filter(
+                member_of(request.user),
+                hackathon_id=hackathon_id
+            )
+            team = with_team_relations(teams).first()
+            if team:
+                return Response(TeamSerializer(team).data, status=status.HTTP_200_OK)
+        else:
+            # Most callers only need to know whether the user has a team here, served from cache
+            team = user_hackathon_team(request.user, hackathon_id)
+            if team:
+                return Response(team, status=status.HTTP_200_OK)
         return Response({'message': 'No team found for this hackathon'}, status=status.HTTP_404_NOT_FOUND)
     
     @swagger_auto_schema(
         request_body=AcceptTeamInvitationSerializer,
+        manual_parameters=[include_members_param],
         responses={
             200: "Successfully joined team",
             400: "Bad Request - invalid or expired token",
@@ -228,7 +414,7 @@ class TeamViewSet(ModelViewSet):
         result = serializer.save()
         return Response({
             'message': result['message'],
-            'team': TeamSerializer(result['team']).data
+            'team': self.get_mutation_team_data(result['team'])
         }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -240,13 +426,12 @@ class TeamViewSet(ModelViewSet):
         tags=['teams']
     )
     @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=team_detail_etag))
     def details(self, request, pk=None):
         """Get team details by ID"""
-        try:
-            team = Team.objects.get(pk=pk)
-            return Response(TeamSerializer(team).data, status=status.HTTP_200_OK)
-        except Team.DoesNotExist:
-            return Response({'error': 'Team not found'}, status=status.HTTP_404_NOT_FOUND)
+        # Deliberately not self.get_object(): details is open to non-members browsing teams to join
+        team = get_object_or_404(with_team_relations(Team.objects.all()), pk=pk)
+        return Response(self.get_serializer(team).data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -278,17 +463,11 @@ class TeamViewSet(ModelViewSet):
         team_id = request.query_params.get('team_id')
         status_filter = request.query_params.get('status')
         
-        # Get teams where user is organizer
-        organized_teams = Team.objects.filter(organizer=request.user)
-        
-        # Get join requests for teams user organizes
-        join_requests = TeamJoinRequest.objects.filter(team__in=organized_teams)
-        
-        # Also include requests made by the user
-        user_requests = TeamJoinRequest.objects.filter(user=request.user)
-        
-        # Combine and get distinct
-        all_requests = (join_requests | user_requests).distinct()
+        # Requests for teams the user organizes, plus requests made by the user.
+        # The team join is many-to-one, so each request row matches once and needs no DISTINCT
+        all_requests = TeamJoinRequest.objects.filter(
+            Q(team__organizer_id=request.user.id) | Q(user_id=request.user.id)
+        )
         
         # Apply filters
         if team_id:
@@ -303,12 +482,12 @@ class TeamViewSet(ModelViewSet):
             all_requests = all_requests.filter(status=status_filter)
         
         # Order by created_at (newest first)
-        all_requests = all_requests.order_by('-created_at')
+        all_requests = TeamJoinRequestSerializer.setup_eager_loading(all_requests).order_by('-created_at')
         
-        serializer = TeamJoinRequestSerializer(all_requests, many=True)
+        data = TeamJoinRequestSerializer(all_requests, many=True).data
         return Response({
-            'count': all_requests.count(),
-            'join_requests': serializer.data
+            'count': len(data),
+            'join_requests': data
         }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -342,14 +521,14 @@ class TeamViewSet(ModelViewSet):
         except ValueError:
             return Response({'error': 'Invalid team_id'}, status=status.HTTP_400_BAD_REQUEST)
         
-        team = get_object_or_404(Team, id=team_id)
+        team = self.get_team(team_id)
         
         # Check if user is organizer
-        if team.organizer != request.user:
+        if team.organizer_id != request.user.id:
             return Response({'error': 'Only the team organizer can view join requests'}, status=status.HTTP_403_FORBIDDEN)
         
-        join_requests = TeamJoinRequest.objects.filter(team=team).order_by('-created_at')
-        serializer = TeamJoinRequestSerializer(join_requests, many=True)
+        join_requests = TeamJoinRequestSerializer.setup_eager_loading(TeamJoinRequest.objects.filter(team=team)).order_by('-created_at')
+        data = TeamJoinRequestSerializer(join_requests, many=True).data
         
         return Response({
             'team': {
@@ -357,8 +536,8 @@ class TeamViewSet(ModelViewSet):
                 'name': team.name,
                 'hackathon': team.hackathon.title
             },
-            'count': join_requests.count(),
-            'join_requests': serializer.data
+            'count': len(data),
+            'join_requests': data
         }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -371,12 +550,12 @@ class TeamViewSet(ModelViewSet):
     @action(detail=False, methods=['get'])
     def my_join_requests(self, request):
         """Get all join requests made by the authenticated user"""
-        join_requests = TeamJoinRequest.objects.filter(user=request.user).order_by('-created_at')
-        serializer = TeamJoinRequestSerializer(join_requests, many=True)
+        join_requests = TeamJoinRequestSerializer.setup_eager_loading(TeamJoinRequest.objects.filter(user=request.user)).order_by('-created_at')
+        data = TeamJoinRequestSerializer(join_requests, many=True).data
         
         return Response({
-            'count': join_requests.count(),
-            'join_requests': serializer.data
+            'count': len(data),
+            'join_requests': data
         }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -404,14 +583,17 @@ class TeamViewSet(ModelViewSet):
         if not team_id:
             return Response({'error': 'team_id is required'}, status=400)
 
-        team = get_object_or_404(Team, id=team_id)
+        team = self.get_team(team_id)
         user = request.user
 
-        if team.members.filter(id=user.id).exists():
+        # One lookup of the user's team in this hackathon answers both membership checks.
+        # It guards a write, so it reads the database rather than the by_hackathon cache.
+        current_team_id = Team.objects.filter(
+            member_of(user), hackathon_id=team.hackathon_id
+        ).values_list('id', flat=True).first()
+        if current_team_id == team.id:
             return Response({'error': 'You are already a member of this team'}, status=400)
-
-        already_in_team = Team.objects.filter(hackathon=team.hackathon, members=user).exists()
-        if already_in_team:
+        if current_team_id:
             return Response({'error': 'You are already in a team for this hackathon'}, status=400)
 
         join_request, created = TeamJoinRequest.objects.get_or_create(team=team, user=user, defaults={'status': 'pending'})
@@ -422,14 +604,14 @@ class TeamViewSet(ModelViewSet):
             elif join_request.status == 'approved':
                 return Response({'error': 'Your join request was already approved'}, status=400)
             elif join_request.status == 'rejected':
-                # Allow resubmission if previously rejected
+                # Allow resubmission if previously rejected; only the status column changes
+                TeamJoinRequest.objects.filter(pk=join_request.pk, status='rejected').update(status='pending')
                 join_request.status = 'pending'
-                join_request.save()
             else:
                 return Response({'error': 'Join request already exists'}, status=400)
 
         # Notify team organizer and members
-        user_name = (user.first_name + ' ' + user.last_name).strip() or user.username
+        user_name = display_name(user)
         subject = f"New Join Request for Team: {team.name}"
         message = f"Dear Team,\n\n{user_name} ({user.email}) has requested to join your team '{team.name}' for '{team.hackathon.title}'.\n\nPlease review and respond to the request."
         
@@ -446,19 +628,17 @@ class TeamViewSet(ModelViewSet):
                 data={'team_id': team.id, 'join_request_id': join_request.id, 'action': 'join_request_received'}
             )
         
-        # Notify all team members
-        for member in team.members.all():
-            if member != user:  # Don't notify the requester
-                NotificationService.send_notification(
-                    user=member,
-                    title=subject,
-                    message=message,
-                    category='team',
-                    priority='normal',
-                    send_email=False,  # Only notify organizer via email
-                    send_in_app=True,
-                    data={'team_id': team.id, 'join_request_id': join_request.id, 'action': 'join_request_received'}
-                )
+        # Notify the other team members in one batch; the organizer was notified above
+        NotificationService.send_bulk_notifications(
+            users=team.members.exclude(id__in=[user.id, team.organizer_id]),
+            title=subject,
+            message=message,
+            category='team',
+            priority='normal',
+            send_email=False,  # Only notify organizer via email
+            send_in_app=True,
+            data={'team_id': team.id, 'join_request_id': join_request.id, 'action': 'join_request_received'}
+        )
 
         return Response({
             'message': 'Join request sent successfully',
@@ -497,78 +677,71 @@ class TeamViewSet(ModelViewSet):
         if not team_id:
             return Response({'error': 'team_id is required'}, status=400)
 
-        team = get_object_or_404(Team, id=team_id)
+        team = self.get_team(team_id)
 
         # Check if user is organizer (using organizer field, not creator)
-        if team.organizer != request.user:
+        if team.organizer_id != request.user.id:
             return Response({'error': 'Only the team organizer can approve requests.'}, status=403)
 
         # Get join request
-        if join_request_id:
-            join_request = TeamJoinRequest.objects.filter(id=join_request_id, team=team, status='pending').first()
-        elif user_id:
-            join_request = TeamJoinRequest.objects.filter(team=team, user_id=user_id, status='pending').first()
-        else:
-            join_request = TeamJoinRequest.objects.filter(team=team, status='pending').first()
+        join_request = self.get_pending_join_request(team, join_request_id, user_id)
 
         if not join_request:
             return Response({'error': 'No pending join request found for this team.'}, status=404)
 
+        with transaction.atomic():
+            # Conditional UPDATE so a request approved or rejected concurrently is not approved twice
+            if not TeamJoinRequest.objects.filter(pk=join_request.pk, status='pending').update(status='approved'):
+                return Response({'error': 'No pending join request found for this team.'}, status=404)
+            team.members.add(join_request.user)
+
+            # Update hackathon participant record if exists
+            HackathonParticipant.objects.filter(
+                hackathon_id=team.hackathon_id,
+                user_id=join_request.user_id
+            ).update(team=team, looking_for_team=False)
         join_request.status = 'approved'
-        join_request.save()
-        team.members.add(join_request.user)
-
-        # Update hackathon participant record
-        from hackathon.models import HackathonParticipant
-        try:
-            participant = HackathonParticipant.objects.get(
-                hackathon=team.hackathon,
-                user=join_request.user
-            )
-            participant.team = team
-            participant.looking_for_team = False
-            participant.save()
-        except HackathonParticipant.DoesNotExist:
-            pass
 
         # Notify the requester
-        user_name = (join_request.user.first_name + ' ' + join_request.user.last_name).strip() or join_request.user.username
+        user_name = display_name(join_request.user)
         subject = f"Join Request Approved: {team.name}"
         message = f"Congratulations {user_name}!\n\nYour request to join the team '{team.name}' for '{team.hackathon.title}' has been approved.\n\nYou are now a member of the team!"
-        
-        NotificationService.send_notification(
-            user=join_request.user,
-            title=subject,
-            message=message,
-            category='team',
-            priority='normal',
-            send_email=True,
-            send_in_app=True,
-            data={'team_id': team.id, 'action': 'join_request_approved'}
-        )
 
         # Notify team members
-        organizer_name = (team.organizer.first_name + ' ' + team.organizer.last_name).strip() if team.organizer else 'Team Organizer'
         member_subject = f"New Member Joined: {team.name}"
         member_message = f"Dear Team,\n\n{user_name} has joined the team '{team.name}'.\n\nWelcome to the team!"
-        
-        for member in team.members.all():
-            if member != join_request.user:  # Don't notify the new member
-                NotificationService.send_notification(
-                    user=member,
-                    title=member_subject,
-                    message=member_message,
-                    category='team',
-                    priority='normal',
-                    send_email=False,
-                    send_in_app=True,
-                    data={'team_id': team.id, 'new_member_id': join_request.user.id, 'action': 'member_joined'}
-                )
 
+        def send_approval_notifications():
+            NotificationService.send_notification(
+                user=join_request.user,
+                title=subject,
+                message=message,
+                category='team',
+                priority='normal',
+                send_email=True,
+                send_in_app=True,
+                data={'team_id': team.id, 'action': 'join_request_approved'}
+            )
+            NotificationService.send_bulk_notifications(
+                users=team.members.exclude(id=join_request.user_id),  # Don't notify the new member
+                title=member_subject,
+                message=member_message,
+                category='team',
+                priority='normal',
+                send_email=False,
+                send_in_app=True,
+                data={'team_id': team.id, 'new_member_id': join_request.user_id, 'action': 'member_joined'}
+            )
+
+        # The requester's email goes out over SMTP; never do that while the approval's rows are locked
+        transaction.on_commit(send_approval_notifications)
+
+        # Re-read with the serializer's relations eager-loaded rather than lazily per field
+        team = with_team_relations(Team.objects.filter(pk=team.pk)).get()
         return Response({
             'message': f'{join_request.user.username} has been added to the team.',
             'join_request': TeamJoinRequestSerializer(join_request).data,
-            'team': TeamSerializer(team).data
+            'team': TeamSerializer(team, context={'request': request}).data
         }, status=200)
         
     @swagger_auto_schema(
@@ -602,28 +775,24 @@ class TeamViewSet(ModelViewSet):
         if not team_id:
             return Response({'error': 'team_id is required'}, status=400)
 
-        team = get_object_or_404(Team, id=team_id)
+        team = self.get_team(team_id)
 
         # Check if user is organizer (using organizer field, not creator)
-        if team.organizer != request.user:
+        if team.organizer_id != request.user.id:
             return Response({'error': 'Only the team organizer can reject requests.'}, status=403)
 
         # Get join request
-        if join_request_id:
-            join_request = TeamJoinRequest.objects.filter(id=join_request_id, team=team, status='pending').first()
-        elif user_id:
-            join_request = TeamJoinRequest.objects.filter(team=team, user_id=user_id, status='pending').first()
-        else:
-            join_request = TeamJoinRequest.objects.filter(team=team, status='pending').first()
+        join_request = self.get_pending_join_request(team, join_request_id, user_id)
 
         if not join_request:
             return Response({'error': 'No pending join request found for this team.'}, status=404)
 
+        if not TeamJoinRequest.objects.filter(pk=join_request.pk, status='pending').update(status='rejected'):
+            return Response({'error': 'No pending join request found for this team.'}, status=404)
         join_request.status = 'rejected'
-        join_request.save()
 
         # Notify the requester
-        user_name = (join_request.user.first_name + ' ' + join_request.user.last_name).strip() or join_request.user.username
+        user_name = display_name(join_request.user)
         subject = f"Join Request Update: {team.name}"
         message = f"Dear {user_name},\n\nYour request to join the team '{team.name}' for '{team.hackathon.title}' has been declined.\n\nYou can try joining another team or create your own team for this hackathon."
         
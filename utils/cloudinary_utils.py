@@ -1,9 +1,47 @@
+import re
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import cloudinary
+import cloudinary.exceptions
 import cloudinary.uploader
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
 
 
+# public_id is everything after /upload/ and the optional version segment, minus the extension
+_PUBLIC_ID_RE = re.compile(r'/upload/(?:v\d+/)?(.+?)\.[^./]+$')
+
+
+# Shared upload options; these helpers only upload images, which spares Cloudinary the 'auto' type detection
+_DEFAULT_UPLOAD_OPTS = types.MappingProxyType({
+    'resource_type': 'image',
+    'quality': 'auto',  # Optimize quality
+    'fetch_format': 'auto',  # Optimize format
+})
+
+
+@lru_cache(maxsize=4096)
+def _public_id_from_url(image_url):
+    """public_id of a Cloudinary asset URL, or None for anything else; memoized for repeated deletes"""
+    if not image_url or 'cloudinary.com' not in image_url:
+        return None
+    match = _PUBLIC_ID_RE.search(image_url)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=1)
+def _ensure_configured():
+    """Configure the Cloudinary SDK from settings.CLOUDINARY_STORAGE once per process"""
+    cloudinary.config(
+        cloud_name=settings.CLOUDINARY_STORAGE['CLOUD_NAME'],
+        api_key=settings.CLOUDINARY_STORAGE['API_KEY'],
+        api_secret=settings.CLOUDINARY_STORAGE['API_SECRET']
+    )
+    return True
+
+
 def upload_image_to_cloudinary(image_file, folder=None):
     """
     Upload an image file to Cloudinary and return the URL.
@@ -20,25 +58,17 @@ def upload_image_to_cloudinary(image_file, folder=None):
     """
     try:
         # Configure cloudinary (this will use settings.CLOUDINARY_STORAGE)
-        cloudinary.config(
-            cloud_name=settings.CLOUDINARY_STORAGE['CLOUD_NAME'],
-            api_key=settings.CLOUDINARY_STORAGE['API_KEY'],
-            api_secret=settings.CLOUDINARY_STORAGE['API_SECRET']
-        )
-        
-        # Upload options
-        upload_options = {
-            'resource_type': 'auto',  # Automatically detect file type
-            'quality': 'auto',  # Optimize quality
-            'fetch_format': 'auto',  # Optimize format
-        }
+        _ensure_configured()
         
-        # Add folder if specified
-        if folder:
-            upload_options['folder'] = folder
+        # Upload options, with the folder added if specified
+        upload_options = {**_DEFAULT_UPLOAD_OPTS, 'folder': folder} if folder else _DEFAULT_UPLOAD_OPTS
             
+        # A TemporaryUploadedFile is already on disk; upload it from its path
+        # so the SDK streams the file instead of buffering it in memory
+        path = image_file.temporary_file_path() if hasattr(image_file, 'temporary_file_path') else None
+        
         # Upload the image
-        result = cloudinary.uploader.upload(image_file, **upload_options)
+        result = cloudinary.uploader.upload(path or image_file, **upload_options)
         
         # Return the secure URL
         return result.get('secure_url')
@@ -47,6 +77,33 @@ def upload_image_to_cloudinary(image_file, folder=None):
         raise ValidationError(f"Failed to upload image to Cloudinary: {str(e)}")
 
 
+def upload_images_to_cloudinary(image_files, folder=None, max_workers=4):
+    """
+    Upload several image files to Cloudinary concurrently and return their URLs.
+    
+    Uploads overlap on a small thread pool instead of running back to back; the
+    Cloudinary SDK reuses its pooled HTTPS connections across the threads.
+    
+    Args:
+        image_files: Iterable of image files from request.FILES
+        folder: Optional folder name to organize uploads in Cloudinary
+        max_workers: Maximum number of uploads in flight at once
+        
+    Returns:
+        list: The Cloudinary URLs, in the same order as image_files
+        
+    Raises:
+        ValidationError: If any upload fails or a file is invalid
+    """
+    image_files = list(image_files)
+    if not image_files:
+        return []
+    
+    _ensure_configured()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(image_files))) as executor:
+        return list(executor.map(lambda image_file: upload_image_to_cloudinary(image_file, folder), image_files))
+
+
 def delete_image_from_cloudinary(image_url):
     """
     Delete an image from Cloudinary using its URL.
@@ -57,29 +114,19 @@ def delete_image_from_cloudinary(image_url):
     Returns:
         bool: True if deletion was successful, False otherwise
     """
+    # Extract public_id from URL, anything that is not a Cloudinary asset returns before any setup
+    # Cloudinary URLs format: https://res.cloudinary.com/{cloud_name}/image/upload/v{version}/{public_id}.{extension}
+    public_id = _public_id_from_url(image_url)
+    if not public_id:
+        return False
+    
+    # Configure cloudinary, a missing CLOUDINARY_STORAGE setting is a configuration bug and raises
+    _ensure_configured()
+    
     try:
-        # Configure cloudinary
-        cloudinary.config(
-            cloud_name=settings.CLOUDINARY_STORAGE['CLOUD_NAME'],
-            api_key=settings.CLOUDINARY_STORAGE['API_KEY'],
-            api_secret=settings.CLOUDINARY_STORAGE['API_SECRET']
-        )
-        
-        # Extract public_id from URL
-        # Cloudinary URLs format: https://res.cloudinary.com/{cloud_name}/image/upload/{transformations}/{public_id}.{extension}
-        if image_url and 'cloudinary.com' in image_url:
-            # Split URL and extract public_id
-            url_parts = image_url.split('/')
-            if len(url_parts) >= 7:
-                # Get the part after 'upload/' and remove file extension
-                public_id_with_ext = '/'.join(url_parts[7:])
-                public_id = public_id_with_ext.rsplit('.', 1)[0]  # Remove extension
-                
-                # Delete the image
-                result = cloudinary.uploader.destroy(public_id)
-                return result.get('result') == 'ok'
-                
+        # Delete the image; the SDK reports API and network failures as cloudinary.exceptions.Error
+        result = cloudinary.uploader.destroy(public_id)
+    except cloudinary.exceptions.Error:
         return False
-        
-    except Exception:
-        return False
\ No newline at end of file
+    
+    return result.get('result') == 'ok'
\ No newline at end of file
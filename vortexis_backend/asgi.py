@@ -9,7 +9,6 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 from channels.routing import ProtocolTypeRouter, URLRouter
-from channels.auth import AuthMiddlewareStack
 from django.core.asgi import get_asgi_application
 from django.urls import path
 
@@ -17,16 +16,34 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vortexis_backend.settings')
 
 django_asgi_app = get_asgi_application()
 
-from communications.consumers import ConversationConsumer  # noqa: E402
-from communications.auth import JWTAuthMiddlewareStack  # noqa: E402
 
-websocket_urlpatterns = [
-    path('ws/communications/conversations/<int:conversation_id>/', ConversationConsumer.as_asgi()),
-]
+class LazyWebsocketRouter:
+    """
+    Websocket application built on the first websocket connection.
+
+    The consumers and the JWT middleware are only imported once a websocket
+    is opened, so workers that only serve HTTP never load them.
+    """
+
+    def __init__(self):
+        self.app = None
+
+    def build(self):
+        from communications.consumers import ConversationConsumer
+        from communications.auth import JWTAuthMiddlewareStack
+
+        websocket_urlpatterns = [
+            path('ws/communications/conversations/<int:conversation_id>/', ConversationConsumer.as_asgi()),
+        ]
+        return JWTAuthMiddlewareStack(URLRouter(websocket_urlpatterns))
+
+    async def __call__(self, scope, receive, send):
+        if self.app is None:
+            self.app = self.build()
+        return await self.app(scope, receive, send)
+
 
 application = ProtocolTypeRouter({
     'http': django_asgi_app,
-    'websocket': JWTAuthMiddlewareStack(
-        URLRouter(websocket_urlpatterns)
-    ),
+    'websocket': LazyWebsocketRouter(),
 })
@@ -150,6 +150,11 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'EXCEPTION_HANDLER': 'vortexis_backend.exception_handler.custom_exception_handler',
+    'DEFAULT_RENDERER_CLASSES': [
+        # orjson encodes large list payloads (teams, members) several times faster than stdlib json
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
         'rest_framework.throttling.UserRateThrottle',
@@ -194,6 +199,9 @@ EMAIL_USE_TLS = True
 
 DEFAULT_EMAIL_HOST = 'info@vortexis.com'
 
+# Threads reserved for background team email delivery (see team/tasks.py)
+TEAM_EMAIL_WORKERS = config('TEAM_EMAIL_WORKERS', default=2, cast=int)
+
 GOOGLE_CLIENT_ID = config('GOOGLE_CLIENT_ID')
 GOOGLE_CLIENT_SECRET = config('GOOGLE_CLIENT_SECRET')
 GITHUB_CLIENT_ID = config('GITHUB_CLIENT_ID')
@@ -237,7 +245,12 @@ SWAGGER_SETTINGS = {
             'in': 'header',
         },
     },
+    'USE_SESSION_AUTH': False,
 }
+# Serve the generated OpenAPI schema and docs UI (set False to drop the routes entirely)
+ENABLE_SCHEMA = config('ENABLE_SCHEMA', default=True, cast=bool)
+# Schema generation walks every view, so cache the result instead of rebuilding per request
+SCHEMA_CACHE_TIMEOUT = config('SCHEMA_CACHE_TIMEOUT', default=60 * 60, cast=int)
 FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:3000')
 
 # Redis Configuration
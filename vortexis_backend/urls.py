@@ -17,27 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include, re_path
 from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 from django.conf import settings
 from django.conf.urls.static import static
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Vortexis API",
-        default_version='v1',
-        description="API documentation for vortexis by web3bridge",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
-
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/console/', include('admin_console.urls')),
-    path('swagger<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path(f'api/v1/auth/', include('accounts.urls'), name='accounts'),
     path(f'api/v1/auth/', include('social_auth.urls'), name='social_auth'),
     path(f'api/v1/organization/', include('organization.urls'), name='organization'),
@@ -48,6 +33,25 @@ urlpatterns = [
     path('api/v1/', include('notifications.urls'), name='notifications')
 ]
 
+if settings.DEBUG or settings.ENABLE_SCHEMA:
+    from drf_yasg.views import get_schema_view
+    from drf_yasg import openapi
+
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="Vortexis API",
+            default_version='v1',
+            description="API documentation for vortexis by web3bridge",
+        ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+    urlpatterns += [
+        path('swagger<format>/', schema_view.without_ui(cache_timeout=settings.SCHEMA_CACHE_TIMEOUT), name='schema-json'),
+        path('swagger/', schema_view.with_ui('swagger', cache_timeout=settings.SCHEMA_CACHE_TIMEOUT), name='schema-swagger-ui'),
+        path('redoc/', schema_view.with_ui('redoc', cache_timeout=settings.SCHEMA_CACHE_TIMEOUT), name='schema-redoc'),
+    ]
+
 # Serve media files in development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)